@@ -1,10 +1,10 @@
 """Standard terrains."""
 
-import math
+import functools
 
 import numpy as np
 import numpy.typing as npt
-from noise import pnoise2
+from numba import njit, prange
 from pyrr import Vector3
 
 from revolve2.modular_robot_simulation import Terrain
@@ -61,19 +61,16 @@ def crater(
         int(NUM_EDGES * size[1] * granularity_multiplier),
     )
 
-    rugged = rugged_heightmap(
-        size=size,
+    heightmap = _crater_heightmap(
+        size=(float(size[0]), float(size[1])),
         num_edges=num_edges,
-        density=1.5,
+        ruggedness=ruggedness,
+        curviness=curviness,
     )
-    bowl = bowl_heightmap(num_edges=num_edges)
 
     max_height = ruggedness + curviness
     if max_height == 0.0:
-        heightmap = np.zeros(num_edges)
         max_height = 1.0
-    else:
-        heightmap = (ruggedness * rugged + curviness * bowl) / (ruggedness + curviness)
 
     return Terrain(
         static_geometry=[
@@ -88,11 +85,48 @@ def crater(
     )
 
 
+@functools.lru_cache(maxsize=4)
+def _crater_heightmap(
+    size: tuple[float, float],
+    num_edges: tuple[int, int],
+    ruggedness: float,
+    curviness: float,
+) -> npt.NDArray[np.float32]:
+    """
+    Create the heightmap of a crater terrain.
+
+    Only this final heightmap is cached, not its rugged and bowl components,
+    so each cached crater is held in memory once.
+    The result is read-only because it is shared between all callers.
+
+    :param size: Size of the crater.
+    :param num_edges: How many edges to use for the heightmap.
+    :param ruggedness: How coarse the ground is.
+    :param curviness: Height of the edges of the crater.
+    :returns: The created heightmap as a 2 dimensional float32 array.
+    """
+    if ruggedness == 0.0 and curviness == 0.0:
+        heightmap = np.zeros(num_edges, dtype=np.float32)
+    elif ruggedness == 0.0:
+        heightmap = bowl_heightmap(num_edges=num_edges)
+    elif curviness == 0.0:
+        heightmap = rugged_heightmap(size=size, num_edges=num_edges, density=1.5)
+    else:
+        # blend in place into the freshly created rugged heightmap
+        total = ruggedness + curviness
+        heightmap = rugged_heightmap(size=size, num_edges=num_edges, density=1.5)
+        heightmap *= ruggedness / total
+        heightmap += (curviness / total) * bowl_heightmap(num_edges=num_edges)
+
+    heightmap.setflags(write=False)
+    return heightmap
+
+
 def rugged_heightmap(
     size: tuple[float, float],
     num_edges: tuple[int, int],
     density: float = 1.0,
-) -> npt.NDArray[np.float_]:
+) -> npt.NDArray[np.float32]:
     """
     Create a rugged terrain heightmap.
 
@@ -106,28 +140,138 @@ def rugged_heightmap(
     :param size: Size of the heightmap.
     :param num_edges: How many edges to use for the heightmap.
     :param density: How coarse the ruggedness is.
-    :returns: The created heightmap as a 2 dimensional array.
+    :returns: The created heightmap as a 2 dimensional float32 array.
     """
     OCTAVE = 10
     C1 = 4.0  # arbitrary constant to get nice noise
 
-    return np.fromfunction(
-        np.vectorize(
-            lambda y, x: pnoise2(
-                x / num_edges[0] * C1 * size[0] * density,
-                y / num_edges[1] * C1 * size[1] * density,
-                OCTAVE,
-            ),
-            otypes=[float],
-        ),
-        num_edges,
-        dtype=float,
+    permutation, gradients_x, gradients_y = _perlin_tables(seed=0)
+
+    res = (
+        max(1, int(C1 * size[0] * density)),
+        max(1, int(C1 * size[1] * density)),
     )
 
+    heightmap = np.zeros(num_edges, dtype=np.float32)
+    amplitude = 1.0
+    total_amplitude = 0.0
+    for octave in range(OCTAVE):
+        octave_res = (res[0] * 2**octave, res[1] * 2**octave)
+        # An octave with more noise periods than edges has less than one sample per period.
+        # It only adds aliasing and every next octave is finer still, so stop summing.
+        # The first octave is always summed, so coarse grids still get noise.
+        if octave > 0 and octave_res[0] > num_edges[0] and octave_res[1] > num_edges[1]:
+            break
+        _perlin2d_nb(
+            heightmap,
+            amplitude,
+            octave_res[0],
+            octave_res[1],
+            permutation,
+            gradients_x,
+            gradients_y,
+        )
+        total_amplitude += amplitude
+        amplitude *= 0.5
+    heightmap /= total_amplitude
+    return heightmap
+
+
+@functools.lru_cache(maxsize=8)
+def _perlin_tables(
+    seed: int,
+) -> tuple[npt.NDArray[np.int_], npt.NDArray[np.float_], npt.NDArray[np.float_]]:
+    """
+    Create the permutation and gradient tables used for Perlin noise.
+
+    The result is cached, so it is read-only.
+
+    :param seed: Seed for the random number generator used to create the tables.
+    :returns: A permutation of the integers [0,256), and the x and y components of 256 unit gradient vectors.
+    """
+    rng = np.random.Generator(np.random.PCG64(seed))
+    permutation = rng.permutation(256)
+    angles = 2.0 * np.pi * rng.random(256)
+    gradients_x = np.cos(angles)
+    gradients_y = np.sin(angles)
+    for table in (permutation, gradients_x, gradients_y):
+        table.setflags(write=False)
+    return permutation, gradients_x, gradients_y
+
+
+@njit(cache=True, parallel=True, fastmath=True)  # type: ignore[misc]
+def _perlin2d_nb(
+    out: npt.NDArray[np.float32],
+    amplitude: float,
+    res_x: int,
+    res_y: int,
+    permutation: npt.NDArray[np.int_],
+    gradients_x: npt.NDArray[np.float_],
+    gradients_y: npt.NDArray[np.float_],
+) -> None:
+    """
+    Add a single octave of 2 dimensional Perlin noise to a grid, in place.
+
+    The gradient of each lattice point is found by hashing its coordinates through the permutation table,
+    so the tables stay small no matter how fine the lattice is.
+    Rows are processed in parallel and each cell is computed in a single pass.
+    The only intermediate arrays hold the per-column lattice values, one entry per column.
+
+    :param out: The grid to add the noise to.
+    :param amplitude: Factor the noise is multiplied with before adding it.
+    :param res_x: Number of noise periods along the first axis.
+    :param res_y: Number of noise periods along the second axis.
+    :param permutation: A permutation of the integers [0,256).
+    :param gradients_x: The x components of 256 unit gradient vectors.
+    :param gradients_y: The y components of 256 unit gradient vectors.
+    """
+    shape_x, shape_y = out.shape
+    # an empty grid has no cells, so any step works; this avoids dividing by zero
+    step_x = res_x / max(shape_x, 1)
+    step_y = res_y / max(shape_y, 1)
+
+    # The lattice cell, offset and fade along the second axis are the same for every row,
+    # so compute them once per octave instead of once per cell.
+    cells_y = np.empty(shape_y, dtype=np.int64)
+    ys = np.empty(shape_y)
+    vs = np.empty(shape_y)
+    for j in range(shape_y):
+        coord_y = j * step_y
+        cells_y[j] = int(coord_y)
+        ys[j] = coord_y - cells_y[j]
+        vs[j] = ys[j] * ys[j] * ys[j] * (ys[j] * (ys[j] * 6.0 - 15.0) + 10.0)
+
+    for i in prange(shape_x):
+        coord_x = i * step_x
+        cell_x = int(coord_x)
+        x = coord_x - cell_x
+        u = x * x * x * (x * (x * 6.0 - 15.0) + 10.0)
+        hash_x0 = permutation[cell_x & 255]
+        hash_x1 = permutation[(cell_x + 1) & 255]
+
+        for j in range(shape_y):
+            cell_y = cells_y[j]
+            y = ys[j]
+            v = vs[j]
+
+            h00 = permutation[(hash_x0 + cell_y) & 255]
+            h10 = permutation[(hash_x1 + cell_y) & 255]
+            h01 = permutation[(hash_x0 + cell_y + 1) & 255]
+            h11 = permutation[(hash_x1 + cell_y + 1) & 255]
+
+            n00 = gradients_x[h00] * x + gradients_y[h00] * y
+            n10 = gradients_x[h10] * (x - 1.0) + gradients_y[h10] * y
+            n01 = gradients_x[h01] * x + gradients_y[h01] * (y - 1.0)
+            n11 = gradients_x[h11] * (x - 1.0) + gradients_y[h11] * (y - 1.0)
+
+            n0 = n00 + u * (n10 - n00)
+            n1 = n01 + u * (n11 - n01)
+            out[i, j] += amplitude * (n0 + v * (n1 - n0))
+
 
 def bowl_heightmap(
     num_edges: tuple[int, int],
-) -> npt.NDArray[np.float_]:
+) -> npt.NDArray[np.float32]:
     r"""
     Create a terrain heightmap in the shape of a bowl.
 
@@ -140,20 +284,27 @@ def bowl_heightmap(
     The height of the edges of the bowl is 1.0 and the center is 0.0.
 
     :param num_edges: How many edges to use for the heightmap.
-    :returns: The created heightmap as a 2 dimensional array.
+    :returns: The created heightmap as a 2 dimensional float32 array.
     """
-    return np.fromfunction(
-        np.vectorize(
-            lambda y, x: (x / num_edges[0] * 2.0 - 1.0) ** 2
-            + (y / num_edges[1] * 2.0 - 1.0) ** 2
-            if math.sqrt(
-                (x / num_edges[0] * 2.0 - 1.0) ** 2
-                + (y / num_edges[1] * 2.0 - 1.0) ** 2
-            )
-            <= 1.0
-            else 0.0,
-            otypes=[float],
-        ),
-        num_edges,
-        dtype=float,
-    )
+    x, y = _norm_grid(num_edges)
+    x = x * 2.0 - 1.0
+    y = y * 2.0 - 1.0
+    r2 = x * x + y * y
+    return np.where(r2 <= 1.0, r2, np.float32(0.0))
+
+
+def _norm_grid(
+    num_edges: tuple[int, int],
+) -> tuple[npt.NDArray[np.float32], npt.NDArray[np.float32]]:
+    """
+    Create the normalized coordinates of the edges of a heightmap, ready for broadcasting.
+
+    This lets heightmaps be computed with whole-array operations, instead of a function call per edge.
+
+    :param num_edges: How many edges the heightmap has.
+    :returns: The x coordinates as a column and the y coordinates as a row, both within [0,1).
+    """
+    # an empty axis has no coordinates, so any scale works; this avoids dividing by zero
+    x = np.arange(num_edges[0], dtype=np.float32) * (1.0 / max(num_edges[0], 1))
+    y = np.arange(num_edges[1], dtype=np.float32) * (1.0 / max(num_edges[1], 1))
+    return x[:, None], y[None, :]
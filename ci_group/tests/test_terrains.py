@@ -0,0 +1,34 @@
+"""Tests for the standard terrains."""
+
+import numpy as np
+
+from revolve2.ci_group import terrains
+
+
+def test_rugged_heightmap_coarse_grid() -> None:
+    """A grid coarser than the base noise resolution must still give finite heights."""
+    heightmap = terrains.rugged_heightmap((1.0, 1.0), (3, 3))
+    assert heightmap.shape == (3, 3)
+    assert np.all(np.isfinite(heightmap))
+
+
+def test_crater_coarse_grid() -> None:
+    """A crater with few edges must still give finite heights."""
+    terrain = terrains.crater((2.0, 2.0), 0.5, 1.0, granularity_multiplier=0.05)
+    heights = terrain.static_geometry[0].heights
+    assert heights.shape == (10, 10)
+    assert np.all(np.isfinite(heights))
+
+
+def test_heightmaps_accept_sequences() -> None:
+    """The public heightmap functions must accept any sequence and return arrays owned by the caller."""
+    rugged = terrains.rugged_heightmap([1.0, 1.0], [10, 10])
+    bowl = terrains.bowl_heightmap([10, 10])
+    assert rugged.flags.writeable
+    assert bowl.flags.writeable
+
+
+def test_crater_empty_grid() -> None:
+    """A crater without edges must give an empty heightmap instead of failing."""
+    terrain = terrains.crater((0.0, 0.0), 0.5, 1.0)
+    assert terrain.static_geometry[0].heights.shape == (0, 0)
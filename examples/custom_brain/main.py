@@ -47,10 +47,8 @@ class CustomBrainInstance(BrainInstance):
     Created by the `CustomBrain` class.
     """
 
-    first_left_active_hinge: ActiveHingeV1
-    second_left_active_hinge: ActiveHingeV1
-    first_right_active_hinge: ActiveHingeV1
-    second_right_active_hinge: ActiveHingeV1
+    targets: tuple[tuple[ActiveHingeV1, float], ...]
+    """The fixed target of each active hinge."""
 
     def __init__(
         self,
@@ -67,10 +65,13 @@ class CustomBrainInstance(BrainInstance):
         :param first_right_active_hinge: First right active Hinge.
         :param second_right_active_hinge: Second right active Hinge.
         """
-        self.first_left_active_hinge = first_left_active_hinge
-        self.second_left_active_hinge = second_left_active_hinge
-        self.first_right_active_hinge = first_right_active_hinge
-        self.second_right_active_hinge = second_right_active_hinge
+        # The targets never change, so they are paired with their hinges once instead of every control step.
+        self.targets = (
+            (first_left_active_hinge, 1.0),
+            (second_left_active_hinge, 0.0),
+            (first_right_active_hinge, 0.0),
+            (second_right_active_hinge, -1.0),
+        )
 
     def control(
         self,
@@ -85,10 +86,8 @@ class CustomBrainInstance(BrainInstance):
         :param sensor_state: Interface for reading the current sensor state.
         :param control_interface: Interface for controlling the robot.
         """
-        control_interface.set_active_hinge_target(self.first_left_active_hinge, 1.0)
-        control_interface.set_active_hinge_target(self.second_left_active_hinge, 0.0)
-        control_interface.set_active_hinge_target(self.first_right_active_hinge, 0.0)
-        control_interface.set_active_hinge_target(self.second_right_active_hinge, -1.0)
+        for active_hinge, target in self.targets:
+            control_interface.set_active_hinge_target(active_hinge, target)
 
 
 class CustomBrain(Brain):
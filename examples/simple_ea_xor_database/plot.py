@@ -7,7 +7,7 @@ from experiment import Experiment
 from generation import Generation
 from individual import Individual
 from population import Population
-from sqlalchemy import select
+from sqlalchemy import func, select
 
 from revolve2.experimentation.database import OpenMethod, open_database_sqlite
 from revolve2.experimentation.logging import setup_logging
@@ -23,37 +23,26 @@ def main() -> None:
     )
 
     # Read data from the database into a pandas dataframe.
-    # The loaded dataframe should have the columns `experiment_id`, `generation_index`, and `fitness`.
+    # The database already calculates the max and mean fitness within each generation, for each experiment seperately,
+    # so only one row per generation per experiment has to be loaded.
+    # The loaded dataframe should have the columns `experiment_id`, `generation_index`, `max_fitness`, and `mean_fitness`.
     df = pandas.read_sql(
         select(
             Experiment.id.label("experiment_id"),
             Generation.generation_index,
-            Individual.fitness,
+            func.max(Individual.fitness).label("max_fitness"),
+            func.avg(Individual.fitness).label("mean_fitness"),
         )
         .join_from(Experiment, Generation, Experiment.id == Generation.experiment_id)
         .join_from(Generation, Population, Generation.population_id == Population.id)
-        .join_from(Population, Individual, Population.id == Individual.population_id),
+        .join_from(Population, Individual, Population.id == Individual.population_id)
+        .group_by(Experiment.id, Generation.generation_index),
         dbengine,
     )
 
-    # Calculate the max and mean fitness within in generation, for each experiment seperately.
-    agg_per_experiment_per_generation = (
-        df.groupby(["experiment_id", "generation_index"])
-        .agg({"fitness": ["max", "mean"]})
-        .reset_index()
-    )
-
-    # Give specific names to the new max and mean columns
-    agg_per_experiment_per_generation.columns = [
-        "experiment_id",
-        "generation_index",
-        "max_fitness",
-        "mean_fitness",
-    ]
-
     # For the mean and max fitnesses, calculate the mean and standard deviation with respect to the seperate experiments.
     agg_per_generation = (
-        agg_per_experiment_per_generation.groupby("generation_index")
+        df.groupby("generation_index")
         .agg({"max_fitness": ["mean", "std"], "mean_fitness": ["mean", "std"]})
         .reset_index()
     )
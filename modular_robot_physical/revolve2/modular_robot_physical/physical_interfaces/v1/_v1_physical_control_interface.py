@@ -14,8 +14,15 @@ class V1PhysicalControlInterface(PhysicalControlInterface):
     _PWM_FREQUENCY = 50
     _gpio: pigpio.pi
 
+    _pin_ids: tuple[int, ...]
+    """Ids of the pins used by this controller."""
+
+    _duty_cycles: dict[int, int]
+    """Last duty cycle sent to each pin, so unchanged values are not sent again."""
+
     _CENTER = 157.0
     _ANGLE60 = 64.0
+    _ANGLE_SCALE = _ANGLE60 * 3.0 / math.pi  # duty cycle per radian
 
     def __init__(
         self,
@@ -46,6 +53,8 @@ class V1PhysicalControlInterface(PhysicalControlInterface):
             Pin(pin_id, self._inverse_pin.get(pin_id, False))
             for pin_id in hinge_mapping.values()
         ]
+        self._pin_ids = tuple(pin.pin for pin in self._pins)
+        self._duty_cycles = {}
 
         if self._debug:
             print(f"Using PWM frequency {self._PWM_FREQUENCY}Hz")
@@ -56,6 +65,7 @@ class V1PhysicalControlInterface(PhysicalControlInterface):
                     self._gpio.set_PWM_frequency(pin.pin, self._PWM_FREQUENCY)
                     self._gpio.set_PWM_range(pin.pin, 2048)
                     self._gpio.set_PWM_dutycycle(pin.pin, 0)
+                    self._duty_cycles[pin.pin] = 0
             except AttributeError as err:
                 raise RuntimeError("Could not initialize gpios.") from err
 
@@ -63,11 +73,15 @@ class V1PhysicalControlInterface(PhysicalControlInterface):
         """Stop the signals and the robot."""
         if self._debug:
             print(
-                "Turning off all pwm signals for pins that were used by this controller."
+                f"Turning off all pwm signals for pins that were used by this controller: {self._pin_ids}."
             )
-        for pin in self._pins:
-            if not self._dry:
-                self._gpio.set_PWM_dutycycle(pin.pin, 0)
+        if self._dry:
+            return
+
+        set_pwm_dutycycle = self._gpio.set_PWM_dutycycle
+        for pin_id in self._pin_ids:
+            set_pwm_dutycycle(pin_id, 0)
+            self._duty_cycles[pin_id] = 0
 
     def _set_servo_target(self, pin: Pin, target: float) -> None:
         """
@@ -80,10 +94,12 @@ class V1PhysicalControlInterface(PhysicalControlInterface):
             print(f"{pin.pin:03d} | {target}")
 
         if not self._dry:
-            invert_mul = 1.0 if pin.invert else -1.0
-
-            angle = (
-                self._CENTER
-                + invert_mul * target / (1.0 / 3.0 * math.pi) * self._ANGLE60
-            )
-            self._gpio.set_PWM_dutycycle(pin.pin, angle)
+            scaled = target * self._ANGLE_SCALE
+            angle = self._CENTER + scaled if pin.invert else self._CENTER - scaled
+
+            # Every call is a round trip to the pigpio daemon.
+            # pigpio truncates the duty cycle to an integer, so consecutive targets often result in the same value.
+            duty_cycle = int(angle)
+            if self._duty_cycles.get(pin.pin) != duty_cycle:
+                self._gpio.set_PWM_dutycycle(pin.pin, duty_cycle)
+                self._duty_cycles[pin.pin] = duty_cycle
@@ -1,11 +1,47 @@
+import logging
+
 from revolve2.modular_robot.body.base import ActiveHingeSensor
 from revolve2.modular_robot.sensor_state import ActiveHingeSensorState
 
 from .._physical_sensor_state import PhysicalSensorState
 
 
+class _V1ActiveHingeSensorState(ActiveHingeSensorState):
+    """Implements ActiveHingeSensorState for v1 hardware, which cannot measure hinges."""
+
+    @property
+    def position(self) -> float:
+        """
+        Get the measured position of the active hinge.
+
+        There are no hinge sensors for this hardware, so this is always the center position.
+
+        :returns: The measured position.
+        """
+        return 0.0
+
+
+_ACTIVE_HINGE_SENSOR_STATE = _V1ActiveHingeSensorState()
+
+
 class V1PhysicalSensorState(PhysicalSensorState):
-    """Implements PhysicalSensorState for v1 harware."""
+    """
+    Implements PhysicalSensorState for v1 harware.
+
+    There are no hinge sensors for this hardware, which is indicated by `has_active_hinge_sensors` being False.
+    Callers that depend on hinge feedback should check it.
+    Querying a hinge sensor anyway returns a state that always reports the center position (0.0),
+    and logs a warning the first time this happens.
+    """
+
+    has_active_hinge_sensors: bool
+    """If the hardware can measure the active hinges."""
+
+    _warned_no_active_hinge_sensors = False
+
+    def __init__(self) -> None:
+        """Initialize this object."""
+        self.has_active_hinge_sensors = False
 
     def get_active_hinge_sensor_state(
         self, sensor: ActiveHingeSensor
@@ -13,7 +49,15 @@ class V1PhysicalSensorState(PhysicalSensorState):
         """
         Get sensor states for Hinges.
 
+        There are no hinge sensors for this hardware.
+        A single shared state is returned for every sensor, which always reports the center position.
+
         :param sensor: The sensor to query.
-        :raises NotImplementedError: If there is no implemented sensor of this type.
+        :returns: The sensor state.
         """
-        raise NotImplementedError("There are no hinge sensors for this hardware.")
+        if not V1PhysicalSensorState._warned_no_active_hinge_sensors:
+            logging.warning(
+                "There are no hinge sensors for this hardware. Active hinge sensors will always report the center position."
+            )
+            V1PhysicalSensorState._warned_no_active_hinge_sensors = True
+        return _ACTIVE_HINGE_SENSOR_STATE
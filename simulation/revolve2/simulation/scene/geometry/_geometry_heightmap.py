@@ -21,5 +21,6 @@ class GeometryHeightmap(Geometry):
 
     size: Vector3
     base_thickness: float
-    heights: npt.NDArray[np.float_]  # MxN matrix. outer list is x, inner list is y
+    # MxN matrix. outer list is x, inner list is y
+    heights: npt.NDArray[np.float_ | np.float32]
     color: Color = field(default_factory=lambda: Color(100, 100, 100, 255))